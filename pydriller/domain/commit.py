@@ -20,7 +20,9 @@ ModificationType and Method.
 
 import logging
 from _datetime import datetime
+from collections import OrderedDict
 from enum import Enum
+from hashlib import sha1
 from pathlib import Path
 from typing import List, Set, Dict
 
@@ -34,6 +36,28 @@ logger = logging.getLogger(__name__)
 NULL_TREE = '4b825dc642cb6eb9a060e54bf8d69288fbee4904'
 
 
+_ANALYSIS_CACHE_SIZE = 1024
+_analysis_cache = OrderedDict()
+
+
+def _analyze_source_code(filename: str, source_code: str):
+    # identical sources (renames, reverts, copies, other branches) are
+    # analyzed only once. The cache is keyed on a digest of the source, so
+    # it does not keep the sources themselves alive.
+    digest = sha1(source_code.encode('utf-8', 'surrogatepass')).digest()
+    key = (filename, digest)
+    result = _analysis_cache.get(key)
+    if result is not None:
+        _analysis_cache.move_to_end(key)
+        return result
+
+    result = lizard.analyze_file.analyze_source_code(filename, source_code)
+    _analysis_cache[key] = result
+    if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
+    return result
+
+
 class ModificationType(Enum):
     """
     Type of Modification. Can be ADD, COPY, RENAME, DELETE, MODIFY or UNKNOWN.
@@ -97,10 +121,13 @@ class Modification:  # pylint: disable=R0902
         self.source_code = diff_and_sc['source_code']
         self.source_code_before = diff_and_sc['source_code_before']
 
+        self._added = None
+        self._removed = None
         self._nloc = None
         self._complexity = None
         self._token_count = None
-        self._function_list = []
+        self._lizard_functions = []
+        self._function_list = None
 
     @property
     def added(self) -> int:
@@ -109,11 +136,8 @@ class Modification:  # pylint: disable=R0902
 
         :return: int lines_added
         """
-        added = 0
-        for line in self.diff.replace('\r', '').split("\n"):
-            if line.startswith('+') and not line.startswith('+++'):
-                added += 1
-        return added
+        self._count_added_removed()
+        return self._added
 
     @property
     def removed(self):
@@ -122,11 +146,24 @@ class Modification:  # pylint: disable=R0902
 
         :return: int lines_deleted
         """
-        removed = 0
-        for line in self.diff.replace('\r', '').split("\n"):
-            if line.startswith('-') and not line.startswith('---'):
-                removed += 1
-        return removed
+        self._count_added_removed()
+        return self._removed
+
+    def _count_added_removed(self):
+        if self._added is not None:
+            return
+
+        self._added = self._count_lines_starting_with('+', '+++')
+        self._removed = self._count_lines_starting_with('-', '---')
+
+    def _count_lines_starting_with(self, prefix: str, excluded: str) -> int:
+        # str.count runs in C: counting the line starts directly is much
+        # faster than iterating over the lines of big diffs
+        diff = self.diff
+        count = diff.count('\n' + prefix) - diff.count('\n' + excluded)
+        if diff.startswith(prefix) and not diff.startswith(excluded):
+            count += 1
+        return count
 
     @property
     def old_path(self):
@@ -206,40 +243,58 @@ class Modification:  # pylint: disable=R0902
         :return: list of methods
         """
         self._calculate_metrics()
+        if self._function_list is None:
+            self._function_list = [Method(func)
+                                   for func in self._lizard_functions]
         return self._function_list
 
+    @property
+    def method_count(self) -> int:
+        """
+        Return the number of methods in the file, without building the
+        Method objects.
+
+        :return: number of methods
+        """
+        self._calculate_metrics()
+        return len(self._lizard_functions)
+
     def _calculate_metrics(self):
         if self.source_code and self._nloc is None:
-            l = lizard.analyze_file.analyze_source_code(self.filename,
-                                                        self.source_code)
+            l = _analyze_source_code(self.filename, self.source_code)
 
             self._nloc = l.nloc
             self._complexity = l.CCN
             self._token_count = l.token_count
-
-            for func in l.function_list:
-                self._function_list.append(Method(func))
+            self._lizard_functions = l.function_list
 
     def __eq__(self, other):
         if not isinstance(other, Modification):
             return NotImplemented
         if self is other:
             return True
-        return self.__dict__ == other.__dict__
+        # line counts and metrics are lazily computed caches: they must not
+        # make equality depend on which properties were read
+        return self._old_path == other._old_path and \
+            self._new_path == other._new_path and \
+            self.change_type == other.change_type and \
+            self.diff == other.diff and \
+            self.source_code == other.source_code and \
+            self.source_code_before == other.source_code_before
 
     def __str__(self): # pragma: no cover
-        return (
-            'MODIFICATION\n' +
-            'Old Path: {}\n'.format(self.old_path) +
-            'New Path: {}\n'.format(self.new_path) +
-            'Type: {}\n'.format(self.change_type.name) +
-            'Diff: {}\n'.format(self.diff) +
-            'Source code before: {}\n'.format(self.source_code_before) +
+        return ''.join([
+            'MODIFICATION\n',
+            'Old Path: {}\n'.format(self.old_path),
+            'New Path: {}\n'.format(self.new_path),
+            'Type: {}\n'.format(self.change_type.name),
+            'Diff: {}\n'.format(self.diff),
+            'Source code before: {}\n'.format(self.source_code_before),
             'Source code: {}\n'.format(self.source_code)
-        )
+        ])
 
 
-class Commit:
+class Commit:  # pylint: disable=R0902
     """
     Class representing a Commit. Contains all the important information such
     as hash, author, dates, and modified files.
@@ -259,6 +314,11 @@ class Commit:
         self._main_branch = main_branch
         self.project_path = project_path
 
+        self._author = None
+        self._committer = None
+        self._author_date = None
+        self._committer_date = None
+        self._msg = None
         self._modifications = None
         self._branches = None
 
@@ -278,8 +338,10 @@ class Commit:
 
         :return: author
         """
-        return Developer(self._c_object.author.name,
-                         self._c_object.author.email)
+        if self._author is None:
+            self._author = Developer(self._c_object.author.name,
+                                     self._c_object.author.email)
+        return self._author
 
     @property
     def committer(self) -> Developer:
@@ -288,8 +350,10 @@ class Commit:
 
         :return: committer
         """
-        return Developer(self._c_object.committer.name,
-                         self._c_object.committer.email)
+        if self._committer is None:
+            self._committer = Developer(self._c_object.committer.name,
+                                        self._c_object.committer.email)
+        return self._committer
 
     @property
     def project_name(self) -> str:
@@ -307,7 +371,9 @@ class Commit:
 
         :return: datetime author_datetime
         """
-        return self._c_object.authored_datetime
+        if self._author_date is None:
+            self._author_date = self._c_object.authored_datetime
+        return self._author_date
 
     @property
     def committer_date(self) -> datetime:
@@ -316,7 +382,9 @@ class Commit:
 
         :return: datetime committer_datetime
         """
-        return self._c_object.committed_datetime
+        if self._committer_date is None:
+            self._committer_date = self._c_object.committed_datetime
+        return self._committer_date
 
     @property
     def author_timezone(self) -> int:
@@ -343,7 +411,9 @@ class Commit:
 
         :return: str commit_message
         """
-        return self._c_object.message.strip()
+        if self._msg is None:
+            self._msg = self._c_object.message.strip()
+        return self._msg
 
     @property
     def parents(self) -> List[str]:
@@ -489,24 +559,30 @@ class Commit:
         if self is other:
             return True
 
-        return self.__dict__ == other.__dict__
+        # the other fields are lazily computed caches: they must not make
+        # equality depend on which properties were read
+        return self._c_object == other._c_object and \
+            self._main_branch == other._main_branch and \
+            self.project_path == other.project_path
 
     def __str__(self): # pragma: no cover
-        return (
-            'Hash: {}\n'.format(self.hash) +
-            'Author: {}\n'.format(self.author.name) +
-            'Author email: {}\n'.format(self.author.email) +
-            'Committer: {}\n'.format(self.committer.name) +
-            'Committer email: {}\n'.format(self.committer.email) +
+        author = self.author
+        committer = self.committer
+        return ''.join([
+            'Hash: {}\n'.format(self.hash),
+            'Author: {}\n'.format(author.name),
+            'Author email: {}\n'.format(author.email),
+            'Committer: {}\n'.format(committer.name),
+            'Committer email: {}\n'.format(committer.email),
             'Author date: {}\n'.format(
-                self.author_date.strftime("%Y-%m-%d %H:%M:%S")) +
+                self.author_date.strftime("%Y-%m-%d %H:%M:%S")),
             'Committer date: {}\n'.format(
-                self.committer_date.strftime("%Y-%m-%d %H:%M:%S")) +
-            'Message: {}\n'.format(self.msg) +
-            'Parent: {}\n'.format("\n".join(map(str, self.parents))) +
-            'Merge: {}\n'.format(self.merge) +
+                self.committer_date.strftime("%Y-%m-%d %H:%M:%S")),
+            'Message: {}\n'.format(self.msg),
+            'Parent: {}\n'.format("\n".join(map(str, self.parents))),
+            'Merge: {}\n'.format(self.merge),
             'Modifications: \n{}'.format(
-                "\n".join(map(str, self.modifications))) +
-            'Branches: \n{}'.format("\n".join(map(str, self.branches))) +
+                "\n".join(map(str, self.modifications))),
+            'Branches: \n{}'.format("\n".join(map(str, self.branches))),
             'In main branch: {}\n'.format(self.in_main_branch)
-        )
+        ])
@@ -18,11 +18,13 @@ This module includes 1 class, GitRepository, representing a repository in Git.
 
 import logging
 import os
+import re
 from pathlib import Path
 from threading import Lock
 from typing import List, Dict, Tuple, Set, Generator
 
 from git import Git, Repo, GitCommandError, Commit as GitCommit
+from git.util import hex_to_bin
 
 from pydriller.domain.commit import Commit, ModificationType, Modification
 
@@ -30,6 +32,12 @@ logger = logging.getLogger(__name__)
 
 NULL_TREE = '4b825dc642cb6eb9a060e54bf8d69288fbee4904'
 
+# deleted lines starting with these prefixes are ignored by SZZ
+USELESS_LINE_PREFIXES = ('//', '#', '/*', "'''", '"""', '*')
+
+# starting line numbers of the old and new file in "@@ -1,8 +1,9 @@"
+HUNK_HEADER = re.compile(r'^@@ -(\d+)(?:,\d+)? \+(\d+)')
+
 
 class GitRepository:
     """
@@ -47,6 +55,8 @@ class GitRepository:
         self.project_name = self.path.name
         self.main_branch = None
         self.lock = Lock()
+        self._git = None
+        self._repo = None
 
     @property
     def git(self):
@@ -55,7 +65,9 @@ class GitRepository:
 
         :return: Git
         """
-        return self._open_git()
+        if self._git is None:
+            self._git = self._open_git()
+        return self._git
 
     @property
     def repo(self):
@@ -64,7 +76,9 @@ class GitRepository:
 
         :return: Repo
         """
-        return self._open_repository()
+        if self._repo is None:
+            self._repo = self._open_repository()
+        return self._repo
 
     @property
     def hyper_blame_available(self):
@@ -89,6 +103,18 @@ class GitRepository:
     def _discover_main_branch(self, repo):
         self.main_branch = repo.active_branch.name
 
+    def close(self) -> None:
+        """
+        Release the GitPython objects (and the git processes they keep
+        alive). They are opened again on the next access.
+        """
+        if self._repo is not None:
+            self._repo.close()
+            self._repo = None
+        if self._git is not None:
+            self._git.clear_cache()
+            self._git = None
+
     def get_head(self) -> Commit:
         """
         Get the head commit.
@@ -99,15 +125,18 @@ class GitRepository:
         return Commit(head_commit, self.path, self.main_branch)
 
     def get_list_commits(self, branch: str = None,
-                         reverse_order: bool = True) \
+                         reverse_order: bool = True, **kwargs) \
             -> Generator[Commit, None, None]:
         """
         Return a generator of commits of all the commits in the repo.
+        Additional keyword arguments (e.g. paths or max_count) are forwarded
+        to GitPython's iter_commits.
 
         :return: Generator[Commit], the generator of all the commits in the
             repo
         """
-        for commit in self.repo.iter_commits(branch, reverse=reverse_order):
+        for commit in self.repo.iter_commits(branch, reverse=reverse_order,
+                                             **kwargs):
             yield self.get_commit_from_gitpython(commit)
 
     def get_commit(self, commit_id: str) -> Commit:
@@ -119,6 +148,28 @@ class GitRepository:
         """
         return Commit(self.repo.commit(commit_id), self.path, self.main_branch)
 
+    def get_commits(self, commit_ids: List[str]) -> List[Commit]:
+        """
+        Get the specified commits. All the ids are resolved with a single
+        "git rev-parse" call; the commit data is then read lazily, as for
+        any other commit. One commit is returned for each of the given ids
+        (duplicates included), in the same order.
+
+        :param List[str] commit_ids: hashes (or other revisions) of the
+            commits to analyze
+        :return: List[Commit]
+        """
+        if not commit_ids:
+            return []
+        # rev-parse prints one line per argument, unlike rev-list which
+        # drops duplicated revisions. Its output is already validated, so
+        # the GitPython commits are built without looking them up again.
+        hashes = self.git.rev_parse(
+            *['{}^{{commit}}'.format(commit_id) for commit_id in commit_ids])
+        return [Commit(GitCommit(self.repo, hex_to_bin(_hash)), self.path,
+                       self.main_branch)
+                for _hash in hashes.split('\n')]
+
     def get_commit_from_gitpython(self, commit: GitCommit) -> Commit:
         """
         Build a PyDriller commit object from a GitPython commit object.
@@ -159,9 +210,10 @@ class GitRepository:
         :return: List[str], the list of the files
         """
         _all = []
-        for path, _, files in os.walk(str(self.path)):
-            if '.git' in path:
-                continue
+        for path, dirs, files in os.walk(str(self.path)):
+            # prune .git in place, so that os.walk does not descend into it
+            if '.git' in dirs:
+                dirs.remove('.git')
             for name in files:
                 _all.append(os.path.join(path, name))
         return _all
@@ -177,13 +229,15 @@ class GitRepository:
             self.git.checkout('-f', self.main_branch)
             self._delete_tmp_branch()
 
-    def total_commits(self) -> int:
+    def total_commits(self, branch: str = None) -> int:
         """
-        Calculate total number of commits.
+        Calculate total number of commits. The commits are counted by git
+        itself, without building a Commit object for each of them.
 
+        :param str branch: branch to count the commits of (default HEAD)
         :return: the total number of commits
         """
-        return len(list(self.get_list_commits()))
+        return int(self.git.rev_list('--count', branch or 'HEAD'))
 
     def get_commit_from_tag(self, tag: str) -> Commit:
         """
@@ -223,41 +277,33 @@ class GitRepository:
         :param str diff: diff of the commit
         :return: Dictionary
         """
-        lines = diff.split('\n')
         modified_lines = {'added': [], 'deleted': []}
 
         count_deletions = 0
         count_additions = 0
 
-        for line in lines:
+        for line in diff.split('\n'):
             line = line.rstrip()
-            count_deletions += 1
-            count_additions += 1
-
-            if line.startswith('@@'):
-                count_deletions, count_additions = self._get_line_numbers(line)
+            first = line[:1]
 
-            if line.startswith('-'):
+            if first == '-':
+                count_deletions += 1
                 modified_lines['deleted'].append((count_deletions, line[1:]))
-                count_additions -= 1
-
-            if line.startswith('+'):
+            elif first == '+':
+                count_additions += 1
                 modified_lines['added'].append((count_additions, line[1:]))
-                count_deletions -= 1
-
-            if line == r'\ No newline at end of file':
-                count_deletions -= 1
-                count_additions -= 1
+            elif first == '@' and line.startswith('@@'):
+                count_deletions, count_additions = self._get_line_numbers(line)
+            elif line != r'\ No newline at end of file':
+                count_deletions += 1
+                count_additions += 1
 
         return modified_lines
 
     def _get_line_numbers(self, line):
-        token = line.split(" ")
-        numbers_old_file = token[1]
-        numbers_new_file = token[2]
-        delete_line_number = int(numbers_old_file.split(",")[0]
-                                 .replace("-", "")) - 1
-        additions_line_number = int(numbers_new_file.split(",")[0]) - 1
+        match = HUNK_HEADER.match(line)
+        delete_line_number = int(match.group(1)) - 1
+        additions_line_number = int(match.group(2)) - 1
         return delete_line_number, additions_line_number
 
     def get_commits_last_modified_lines(self, commit: Commit,
@@ -314,6 +360,8 @@ class GitRepository:
             -> Dict[str, Set[str]]:
 
         buggy_commits = {}
+        # blame prints abbreviated hashes: resolve each of them only once
+        full_hashes = {}
 
         for mod in modifications:
             path = mod.new_path
@@ -321,19 +369,28 @@ class GitRepository:
                     mod.change_type == ModificationType.DELETE:
                 path = mod.old_path
             deleted_lines = self.parse_diff(mod.diff)['deleted']
+            if not deleted_lines:
+                continue
             try:
+                # only the lines up to the last deleted one are needed
+                last_line = max(num_line for num_line, _ in deleted_lines)
                 blame = self._get_blame(commit.hash, path,
-                                        hashes_to_ignore_path)
+                                        hashes_to_ignore_path) \
+                    .split('\n', last_line)
                 for num_line, line in deleted_lines:
                     if not self._useless_line(line.strip()):
-                        buggy_commit = blame[num_line - 1].split(' ')[
-                            0].replace('^', '')
+                        buggy_commit = blame[num_line - 1].partition(' ')[
+                            0].lstrip('^')
 
                         if mod.change_type == ModificationType.RENAME:
                             path = mod.new_path
 
+                        if buggy_commit not in full_hashes:
+                            full_hashes[buggy_commit] = self.get_commit(
+                                buggy_commit).hash
+
                         buggy_commits.setdefault(path, set()).add(
-                            self.get_commit(buggy_commit).hash)
+                            full_hashes[buggy_commit])
             except GitCommandError:
                 logger.debug(
                     "Could not found file %s in commit %s. Probably a double "
@@ -347,25 +404,18 @@ class GitRepository:
         If "git hyper-blame" is available, use it. Otherwise use normal blame.
         """
         if not self.hyper_blame_available:
-            return self.git.blame('-w', hash + '^',
-                                  '--', path).split('\n')
+            return self.git.blame('-w', hash + '^', '--', path)
         else:
             cmd = ["git", "hyper-blame", hash + '^', path]
             if hashes_to_ignore_path is not None:
                 cmd.append("--ignore-file={}"
                            .format(hashes_to_ignore_path))
-            return self.git.execute(cmd).split('\n')
+            return self.git.execute(cmd)
 
     def _useless_line(self, line: str):
         # this covers comments in Java and Python, as well as empty lines.
         # More have to be added!
-        return not line or \
-               line.startswith('//') or \
-               line.startswith('#') or \
-               line.startswith("/*") or \
-               line.startswith("'''") or \
-               line.startswith('"""') or \
-               line.startswith("*")
+        return not line or line.startswith(USELESS_LINE_PREFIXES)
 
     def get_commits_modified_file(self, filepath: str) -> List[str]:
         """
@@ -210,17 +210,20 @@ class RepositoryMining:
             if self._only_releases:
                 self._tagged_commits = git_repo.get_tagged_commits()
 
-            for commit in git_repo.get_list_commits(self._only_in_branch,
-                                                    not self._reversed_order):
-                logger.info('Commit #%s in %s from %s', commit.hash,
-                            commit.committer_date,
-                            commit.author.name)
-
-                if self._is_commit_filtered(commit):
-                    logger.info('Commit #%s filtered', commit.hash)
-                    continue
-
-                yield commit
+            try:
+                for commit in git_repo.get_list_commits(
+                        self._only_in_branch, not self._reversed_order):
+                    logger.info('Commit #%s in %s from %s', commit.hash,
+                                commit.committer_date,
+                                commit.author.name)
+
+                    if self._is_commit_filtered(commit):
+                        logger.info('Commit #%s filtered', commit.hash)
+                        continue
+
+                    yield commit
+            finally:
+                git_repo.close()
 
     def _is_commit_filtered(self, commit: Commit):  # pylint: disable=R0911
         if self._single is not None and commit.hash != self._single:
@@ -139,6 +139,71 @@ def test_metrics_not_supported_file():
 
     assert m1.nloc == 2
     assert len(m1.methods) == 0
+    assert m1.method_count == 0
+
+
+@pytest.fixture()
+def lizard_calls(monkeypatch):
+    import lizard
+    from collections import OrderedDict
+    from pydriller.domain import commit
+
+    calls = []
+    analyze = lizard.analyze_file.analyze_source_code
+
+    def counting_analyze(filename, source_code):
+        calls.append(filename)
+        return analyze(filename, source_code)
+
+    monkeypatch.setattr(commit, '_analysis_cache', OrderedDict())
+    monkeypatch.setattr(lizard.analyze_file, 'analyze_source_code',
+                        counting_analyze)
+    return calls
+
+
+def test_metrics_same_source_code(lizard_calls):
+    sc = 'def a():\n    return 1\n'
+
+    diff_and_sc = {
+        'diff': '',
+        'source_code': sc,
+        'source_code_before': ''
+    }
+
+    m1 = Modification(None, 'dspadini/pydriller/myfile.py',
+                      ModificationType.ADD, diff_and_sc)
+    m2 = Modification('dspadini/pydriller/myfile.py',
+                      'dspadini/pydriller/myfile.py',
+                      ModificationType.MODIFY, diff_and_sc)
+
+    assert m1.nloc == m2.nloc == 2
+    assert m1.method_count == 1
+    assert len(m1.methods) == len(m2.methods) == 1
+    assert m1.methods[0] is not m2.methods[0]
+    assert len(lizard_calls) == 1
+
+
+def test_metrics_cache_eviction(lizard_calls, monkeypatch):
+    from pydriller.domain import commit
+    monkeypatch.setattr(commit, '_ANALYSIS_CACHE_SIZE', 2)
+
+    def modification(sc):
+        return Modification(None, 'dspadini/pydriller/myfile.py',
+                            ModificationType.ADD,
+                            {'diff': '', 'source_code': sc,
+                             'source_code_before': ''})
+
+    modification('a = 1\n').nloc
+    modification('b = 1\n').nloc
+    modification('a = 1\n').nloc
+    assert len(lizard_calls) == 2
+
+    # 'b' is now the least recently used entry, and it is evicted
+    modification('c = 1\n').nloc
+    modification('a = 1\n').nloc
+    assert len(lizard_calls) == 3
+    modification('b = 1\n').nloc
+    assert len(lizard_calls) == 4
 
 
 def test_filepahs():
@@ -190,6 +255,27 @@ def test_eq_commit():
     assert c1 != c2
 
 
+def test_eq_commit_after_reading_properties():
+    from pydriller import RepositoryMining
+    h = 'da39b1326dbc2edfe518b90672734a08f3c13458'
+    gr = GitRepository('test-repos/test1/')
+    mined = list(RepositoryMining('test-repos/test1/',
+                                  single=h).traverse_commits())[0]
+    c1 = gr.get_commit(h)
+    c2 = gr.get_commit(h)
+
+    assert mined == c1
+
+    c1.author
+    c1.committer
+    c1.msg
+    c1.author_date
+    c1.committer_date
+    assert c1 == c2
+    assert c2 == c1
+    assert c1 != gr.get_commit('a88c84ddf42066611e76e6cb690144e5357d132c')
+
+
 def test_eq_modifications():
     gr = GitRepository('test-repos/git-1')
     m1 = gr.get_commit('e7d13b0511f8a176284ce4f92ed8c6e8d09c77f2'
@@ -206,6 +292,32 @@ def test_eq_modifications():
     assert m1 != c1
 
 
+def test_author_and_committer_are_cached():
+    gr = GitRepository('test-repos/git-1')
+    c1 = gr.get_commit('e7d13b0511f8a176284ce4f92ed8c6e8d09c77f2')
+
+    assert c1.author is c1.author
+    assert c1.committer is c1.committer
+    assert c1.msg is c1.msg
+    assert c1.author_date is c1.author_date
+    assert c1.committer_date is c1.committer_date
+
+
+def test_eq_modifications_after_reading_properties():
+    gr = GitRepository('test-repos/git-1')
+    m1 = gr.get_commit('e7d13b0511f8a176284ce4f92ed8c6e8d09c77f2'
+                       '').modifications[0]
+    m2 = gr.get_commit('e7d13b0511f8a176284ce4f92ed8c6e8d09c77f2'
+                       '').modifications[0]
+
+    m1.added
+    m1.removed
+    m1.nloc
+    m1.methods
+    assert m1 == m2
+    assert m2 == m1
+
+
 def test_tzoffset():
     gr = GitRepository('test-repos/git-1')
     tz1 = gr.get_commit(
@@ -263,3 +375,24 @@ def test_source_code_before_complete():
 
     assert m1.source_code is None
     assert m1.source_code_before == old_sc
+
+
+def test_added_and_removed_lines():
+    diff_and_sc = {
+        'diff': '@@ -1,4 +1,4 @@\r\n' +
+                '-a\r\n' +
+                '--- b\r\n' +
+                '+aa\r\n' +
+                '+++ bb\r\n' +
+                '++i;\r\n' +
+                ' c\r\n' +
+                '+d',
+        'source_code': '',
+        'source_code_before': ''
+    }
+    m1 = Modification('dspadini/pydriller/myfile.py',
+                      'dspadini/pydriller/myfile.py',
+                      ModificationType.MODIFY, diff_and_sc)
+
+    assert m1.added == 3
+    assert m1.removed == 1
@@ -204,3 +204,18 @@ def test_diff_no_newline():
     assert (1, 'test1') in deleted  # is considered as deleted as a 'newline' command is added
     assert (1, 'test1') in added  # now with added 'newline'
     assert (2, 'test2') in added
+
+
+def test_hunk_headers_without_line_count():
+    diff = '@@ -0,0 +1 @@\r\n' + \
+           '+a\r\n' + \
+           '@@ -5 +6,2 @@ def f():\r\n' + \
+           '-b\r\n' + \
+           '+c\r\n' + \
+           '+d'
+
+    gr = GitRepository('test-repos/test1')
+    parsed_lines = gr.parse_diff(diff)
+
+    assert parsed_lines['added'] == [(1, 'a'), (6, 'c'), (7, 'd')]
+    assert parsed_lines['deleted'] == [(5, 'b')]
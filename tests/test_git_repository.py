@@ -58,6 +58,32 @@ def test_list_commits():
     assert len(change_sets) == 5
 
 
+def test_git_and_repo_are_cached():
+    gr = GitRepository('test-repos/test1/')
+    assert gr.repo is gr.repo
+    assert gr.git is gr.git
+
+    repo = gr.repo
+    gr.close()
+    assert gr.repo is not repo
+    assert gr.get_head().hash == 'da39b1326dbc2edfe518b90672734a08f3c13458'
+
+
+def test_list_commits_forwards_arguments():
+    gr = GitRepository('test-repos/test1/')
+
+    commits = list(gr.get_list_commits(reverse_order=False, max_count=2))
+    assert [c.hash for c in commits] == [
+        'da39b1326dbc2edfe518b90672734a08f3c13458',
+        '1f99848edadfffa903b8ba1286a935f1b92b2845']
+
+    commits = list(gr.get_list_commits(paths='file2.java'))
+    assert [c.hash for c in commits] == [
+        'a88c84ddf42066611e76e6cb690144e5357d132c',
+        '6411e3096dd2070438a17b225f44475136e54e3a',
+        '09f6182cef737db02a085e1d018963c7a29bde5a']
+
+
 def test_get_commit():
     gr = GitRepository('test-repos/test1/')
     c = gr.get_commit('09f6182cef737db02a085e1d018963c7a29bde5a')
@@ -73,6 +99,34 @@ def test_get_commit():
     assert c.in_main_branch is True
 
 
+def test_get_commits():
+    gr = GitRepository('test-repos/test1/')
+    commits = gr.get_commits(['da39b1326dbc2edfe518b90672734a08f3c13458',
+                              'a88c84ddf42066611e76e6cb690144e5357d132c',
+                              '6411e30'])
+
+    assert [c.hash for c in commits] == [
+        'da39b1326dbc2edfe518b90672734a08f3c13458',
+        'a88c84ddf42066611e76e6cb690144e5357d132c',
+        '6411e3096dd2070438a17b225f44475136e54e3a']
+    assert gr.get_commits([]) == []
+
+
+def test_get_commits_with_duplicates():
+    gr = GitRepository('test-repos/test1/')
+    ids = ['da39b1326dbc2edfe518b90672734a08f3c13458',
+           'da39b1326dbc2edfe518b90672734a08f3c13458',
+           '6411e30',
+           'da39b13']
+    commits = gr.get_commits(ids)
+
+    assert [c.hash for c in commits] == [
+        'da39b1326dbc2edfe518b90672734a08f3c13458',
+        'da39b1326dbc2edfe518b90672734a08f3c13458',
+        '6411e3096dd2070438a17b225f44475136e54e3a',
+        'da39b1326dbc2edfe518b90672734a08f3c13458']
+
+
 def test_get_first_commit():
     gr = GitRepository('test-repos/test1/')
     c = gr.get_commit('a88c84ddf42066611e76e6cb690144e5357d132c')
@@ -105,9 +159,27 @@ def test_files():
     assert str(Path('test-repos/test2/fold2/fold3/tmp8.py')) in all
 
 
+def test_files_only_skips_git_folder(tmpdir):
+    tmpdir.mkdir('.git').join('HEAD').write('ref: refs/heads/master')
+    tmpdir.mkdir('.github').join('config.yml').write('')
+    tmpdir.join('my.gitignore').write('')
+
+    gr = GitRepository(str(tmpdir))
+    all = gr.files()
+
+    assert len(all) == 2
+    assert str(Path(str(tmpdir), '.github', 'config.yml')) in all
+    assert str(Path(str(tmpdir), 'my.gitignore')) in all
+
+
 def test_total_commits():
     gr = GitRepository('test-repos/test1/')
     assert gr.total_commits() == 5
+    assert gr.total_commits() == len(list(gr.get_list_commits()))
+
+    gr = GitRepository('test-repos/git-5/')
+    assert gr.total_commits('branch1') == \
+        len(list(gr.get_list_commits('branch1')))
 
 
 def test_get_commit_from_tag():
@@ -3,7 +3,7 @@ from datetime import datetime
 
 import pytest
 
-from pydriller import RepositoryMining
+from pydriller import RepositoryMining, GitRepository
 
 logging.basicConfig(format='%(asctime)s - %(levelname)s - %(message)s',
                     level=logging.INFO)
@@ -79,3 +79,18 @@ def test_badly_formatted_url():
 
     with pytest.raises(Exception):
         list(RepositoryMining(path_to_repo='test').traverse_commits())
+
+
+def test_repository_closed_when_traversal_stops(monkeypatch):
+    closed = []
+    monkeypatch.setattr(GitRepository, 'close',
+                        lambda self: closed.append(self.path))
+
+    commits = RepositoryMining('test-repos/test1').traverse_commits()
+    next(commits)
+    assert closed == []
+    commits.close()
+    assert len(closed) == 1
+
+    list(RepositoryMining('test-repos/test1').traverse_commits())
+    assert len(closed) == 2